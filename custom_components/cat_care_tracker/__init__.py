@@ -83,26 +83,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             await session.async_ensure_token_valid()
             client = create_client()
 
-            # Get last entries for each type
-            data = {}
-
-            for checkin_type in CHECKIN_TYPES:
-                last_entry = await hass.async_add_executor_job(
-                    client.get_last_entry_by_type, checkin_type
-                )
-                data[f"last_{checkin_type}"] = last_entry
-
-            # Get today's entries and counts
-            data["today_entries"] = await hass.async_add_executor_job(
-                client.get_entries_for_date, date.today()
-            )
-            data["today_counts"] = await hass.async_add_executor_job(
-                client.get_today_counts
-            )
-
-            # Get recent entries
-            data["recent_entries"] = await hass.async_add_executor_job(
-                client.get_entries, 20
+            # Last entries per type, today's entries and counts and the
+            # recent entries all come from a single read of the sheet
+            data = await hass.async_add_executor_job(
+                client.get_snapshot, date.today(), 20
             )
 
             return data
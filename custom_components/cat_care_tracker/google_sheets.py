@@ -17,6 +17,7 @@ from .const import (
     CHECKIN_TYPE_INSULIN,
     CHECKIN_TYPE_WATER,
     CHECKIN_TYPE_BG,
+    CHECKIN_TYPES,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -121,39 +122,31 @@ class GoogleSheetsOAuthClient:
             _LOGGER.error("Unexpected error appending entry: %s", err)
             return False
 
+    def _get_values(self) -> list[list[str]]:
+        """Fetch the raw rows of the sheet, header row included."""
+        service = self._get_service()
+        result = (
+            service.spreadsheets()
+            .values()
+            .get(
+                spreadsheetId=self._spreadsheet_id,
+                range=f"{self._sheet_name}!A:E",
+            )
+            .execute()
+        )
+        return result.get("values", [])
+
     def get_entries(self, limit: int = 100) -> list[dict[str, Any]]:
         """Get recent entries from the Google Sheet."""
         try:
-            service = self._get_service()
-            result = (
-                service.spreadsheets()
-                .values()
-                .get(
-                    spreadsheetId=self._spreadsheet_id,
-                    range=f"{self._sheet_name}!A:E",
-                )
-                .execute()
-            )
-
-            values = result.get("values", [])
+            values = self._get_values()
 
             if not values:
                 return []
 
-            headers = values[0] if values else []
-            entries = []
-
+            headers = values[0]
             data_rows = list(reversed(values[1:]))[:limit]
-            for row in data_rows:
-                entry = {}
-                for i, header in enumerate(headers):
-                    if i < len(row):
-                        entry[header] = row[i]
-                    else:
-                        entry[header] = ""
-                entries.append(entry)
-
-            return entries
+            return [_row_to_entry(headers, row) for row in data_rows]
 
         except HttpError as err:
             _LOGGER.error("Failed to get entries: %s", err)
@@ -164,46 +157,125 @@ class GoogleSheetsOAuthClient:
 
     def get_entries_for_date(self, target_date: date) -> list[dict[str, Any]]:
         """Get entries for a specific date."""
-        all_entries = self.get_entries(limit=500)
-        date_str = target_date.strftime("%m/%d/%Y")
-
-        entries = []
-        for entry in all_entries:
-            entry_date = entry.get(COL_DATE, "")
-            if entry_date.startswith(date_str):
-                entries.append(entry)
-
-        return entries
+        snapshot = self._try_get_snapshot(target_date)
+        return snapshot["today_entries"] if snapshot else []
 
     def get_last_entry_by_type(self, checkin_type: str) -> dict[str, Any] | None:
         """Get the most recent entry of a specific check-in type."""
-        entries = self.get_entries(limit=500)
-
-        for entry in entries:
-            types = entry.get(COL_CHECKIN_TYPE, "")
-            if checkin_type in types:
-                return entry
-
-        return None
+        snapshot = self._try_get_snapshot(date.today())
+        return snapshot.get(f"last_{checkin_type}") if snapshot else None
 
     def get_today_counts(self) -> dict[str, int]:
         """Get counts of each check-in type for today."""
-        today_entries = self.get_entries_for_date(date.today())
+        snapshot = self._try_get_snapshot(date.today())
+        if not snapshot:
+            return {checkin_type: 0 for checkin_type in CHECKIN_TYPES}
+        return snapshot["today_counts"]
 
-        counts = {
-            CHECKIN_TYPE_FOOD: 0,
-            CHECKIN_TYPE_WATER: 0,
-            CHECKIN_TYPE_INSULIN: 0,
-            CHECKIN_TYPE_BG: 0,
-        }
+    def _try_get_snapshot(self, target_date: date) -> dict[str, Any] | None:
+        """Get a snapshot, logging and returning None on failure."""
+        try:
+            return self.get_snapshot(target_date, recent_limit=0)
+        except HttpError as err:
+            _LOGGER.error("Failed to get entries: %s", err)
+            return None
+        except Exception as err:
+            _LOGGER.error("Unexpected error getting entries: %s", err)
+            return None
 
-        for entry in today_entries:
-            types = entry.get(COL_CHECKIN_TYPE, "")
-            for checkin_type in counts:
-                if checkin_type in types:
-                    counts[checkin_type] += 1
+    def get_snapshot(
+        self, target_date: date | None = None, recent_limit: int = 20
+    ) -> dict[str, Any]:
+        """Get everything the coordinator needs from a single sheet read.
 
-        return counts
+        Args:
+            target_date: The day to report entries and counts for (defaults to today)
+            recent_limit: Maximum number of recent entries to include
+
+        Returns:
+            Dictionary with a ``last_<type>`` entry for each check-in type,
+            plus ``today_entries``, ``today_counts`` and ``recent_entries``
+
+        Raises:
+            HttpError: If the sheet could not be read
+        """
+        if target_date is None:
+            target_date = date.today()
+
+        values = self._get_values()
+        headers = values[0] if values else []
+        return _build_snapshot(headers, values[1:], target_date, recent_limit)
+
+
+def _row_to_entry(headers: list[str], row: list[str]) -> dict[str, Any]:
+    """Map a raw sheet row onto the header names, padding missing cells."""
+    return {
+        header: row[i] if i < len(row) else ""
+        for i, header in enumerate(headers)
+    }
+
+
+def _cell(row: list[str], index: int | None) -> str:
+    """Return a cell of a raw row, or an empty string if it is missing."""
+    if index is None or index >= len(row):
+        return ""
+    return row[index]
+
+
+def _build_snapshot(
+    headers: list[str],
+    rows: list[list[str]],
+    target_date: date,
+    recent_limit: int,
+) -> dict[str, Any]:
+    """Compute last-per-type, day entries, day counts and recent entries in one pass.
+
+    Rows are walked newest first and only turned into entry dicts when they
+    are actually needed, so large sheets cost a single cheap scan.
+    """
+    date_str = target_date.strftime("%m/%d/%Y")
+    date_idx = headers.index(COL_DATE) if COL_DATE in headers else None
+    type_idx = (
+        headers.index(COL_CHECKIN_TYPE) if COL_CHECKIN_TYPE in headers else None
+    )
+
+    last_entries: dict[str, dict[str, Any] | None] = {
+        checkin_type: None for checkin_type in CHECKIN_TYPES
+    }
+    counts = {checkin_type: 0 for checkin_type in CHECKIN_TYPES}
+    today_entries: list[dict[str, Any]] = []
+    recent_entries: list[dict[str, Any]] = []
+
+    for row in reversed(rows):
+        entry = None
+        row_date = _cell(row, date_idx)
+        types = _cell(row, type_idx)
+
+        if len(recent_entries) < recent_limit:
+            entry = _row_to_entry(headers, row)
+            recent_entries.append(entry)
+
+        is_today = row_date.startswith(date_str)
+        if is_today:
+            entry = entry or _row_to_entry(headers, row)
+            today_entries.append(entry)
+
+        for checkin_type in CHECKIN_TYPES:
+            if checkin_type not in types:
+                continue
+            if is_today:
+                counts[checkin_type] += 1
+            if last_entries[checkin_type] is None:
+                entry = entry or _row_to_entry(headers, row)
+                last_entries[checkin_type] = entry
+
+    data: dict[str, Any] = {
+        f"last_{checkin_type}": entry for checkin_type, entry in last_entries.items()
+    }
+    data["today_entries"] = today_entries
+    data["today_counts"] = counts
+    data["recent_entries"] = recent_entries
+    return data
 
 
 class GoogleSheetsClient:
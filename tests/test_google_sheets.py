@@ -240,6 +240,126 @@ class TestGoogleSheetsOAuthClient:
         assert food_entry is not None
         assert "Insulin" in food_entry["Checkin Type"]
 
+    @patch("custom_components.cat_care_tracker.google_sheets.build")
+    @patch("custom_components.cat_care_tracker.google_sheets.OAuthCredentials")
+    def test_get_snapshot(self, mock_creds, mock_build):
+        """Test the snapshot is computed from a single sheet read."""
+        today_str = date.today().strftime("%m/%d/%Y")
+        mock_service = MagicMock()
+        mock_get = mock_service.spreadsheets().values().get
+        mock_get().execute.return_value = {
+            "values": [
+                ["Timestamp", "Date", "Checkin Type", "Water Refill", "BG (mg/dL)"],
+                ["01/14/2024 20:00:00", "01/14/2024 20:00", "Blood Glucose Measurement", "", "180"],
+                [f"{today_str} 07:00:00", f"{today_str} 07:00", "Water", "250ml", ""],
+                [f"{today_str} 08:30:00", f"{today_str} 08:30", "Food, Insulin", "", ""],
+                [f"{today_str} 12:00:00", f"{today_str} 12:00", "Food", "", ""],
+            ]
+        }
+        mock_get.reset_mock()
+        mock_build.return_value = mock_service
+
+        client = GoogleSheetsOAuthClient("test_token", "test_spreadsheet_id")
+        snapshot = client.get_snapshot(date.today(), recent_limit=2)
+
+        mock_get.assert_called_once()
+        assert snapshot[f"last_{CHECKIN_TYPE_FOOD}"]["Date"] == f"{today_str} 12:00"
+        assert snapshot[f"last_{CHECKIN_TYPE_INSULIN}"]["Date"] == f"{today_str} 08:30"
+        assert snapshot[f"last_{CHECKIN_TYPE_WATER}"]["Water Refill"] == "250ml"
+        assert snapshot[f"last_{CHECKIN_TYPE_BG}"]["BG (mg/dL)"] == "180"
+        assert len(snapshot["today_entries"]) == 3
+        assert snapshot["today_counts"] == {
+            CHECKIN_TYPE_FOOD: 2,
+            CHECKIN_TYPE_WATER: 1,
+            CHECKIN_TYPE_INSULIN: 1,
+            CHECKIN_TYPE_BG: 0,
+        }
+        assert [e["Date"] for e in snapshot["recent_entries"]] == [
+            f"{today_str} 12:00",
+            f"{today_str} 08:30",
+        ]
+
+    @patch("custom_components.cat_care_tracker.google_sheets.build")
+    @patch("custom_components.cat_care_tracker.google_sheets.OAuthCredentials")
+    def test_get_snapshot_empty(self, mock_creds, mock_build):
+        """Test the snapshot of an empty sheet."""
+        mock_service = MagicMock()
+        mock_service.spreadsheets().values().get().execute.return_value = {"values": []}
+        mock_build.return_value = mock_service
+
+        client = GoogleSheetsOAuthClient("test_token", "test_spreadsheet_id")
+        snapshot = client.get_snapshot()
+
+        assert snapshot[f"last_{CHECKIN_TYPE_FOOD}"] is None
+        assert snapshot["today_entries"] == []
+        assert snapshot["recent_entries"] == []
+        assert snapshot["today_counts"][CHECKIN_TYPE_FOOD] == 0
+
+    @patch("custom_components.cat_care_tracker.google_sheets.build")
+    @patch("custom_components.cat_care_tracker.google_sheets.OAuthCredentials")
+    def test_get_snapshot_short_rows(self, mock_creds, mock_build):
+        """Test rows shorter than the Date / Checkin Type columns are padded."""
+        today_str = date.today().strftime("%m/%d/%Y")
+        mock_service = MagicMock()
+        mock_service.spreadsheets().values().get().execute.return_value = {
+            "values": [
+                ["Timestamp", "Date", "Checkin Type", "Water Refill", "BG (mg/dL)"],
+                [f"{today_str} 08:30:00", f"{today_str} 08:30", "Food"],
+                [f"{today_str} 09:00:00", f"{today_str} 09:00"],
+                [f"{today_str} 09:30:00"],
+            ]
+        }
+        mock_build.return_value = mock_service
+
+        client = GoogleSheetsOAuthClient("test_token", "test_spreadsheet_id")
+        snapshot = client.get_snapshot(date.today())
+
+        assert len(snapshot["recent_entries"]) == 3
+        assert snapshot["recent_entries"][0]["Date"] == ""
+        assert snapshot["recent_entries"][1]["Checkin Type"] == ""
+        assert len(snapshot["today_entries"]) == 2
+        assert snapshot["today_counts"][CHECKIN_TYPE_FOOD] == 1
+        assert snapshot[f"last_{CHECKIN_TYPE_FOOD}"]["Water Refill"] == ""
+
+    @patch("custom_components.cat_care_tracker.google_sheets.build")
+    @patch("custom_components.cat_care_tracker.google_sheets.OAuthCredentials")
+    def test_get_snapshot_missing_date_header(self, mock_creds, mock_build):
+        """Test a sheet without a Date column still reports last entries."""
+        today_str = date.today().strftime("%m/%d/%Y")
+        mock_service = MagicMock()
+        mock_service.spreadsheets().values().get().execute.return_value = {
+            "values": [
+                ["Timestamp", "Checkin Type"],
+                [f"{today_str} 08:30:00", "Food"],
+            ]
+        }
+        mock_build.return_value = mock_service
+
+        client = GoogleSheetsOAuthClient("test_token", "test_spreadsheet_id")
+        snapshot = client.get_snapshot(date.today())
+
+        assert snapshot["today_entries"] == []
+        assert snapshot["today_counts"][CHECKIN_TYPE_FOOD] == 0
+        assert snapshot[f"last_{CHECKIN_TYPE_FOOD}"]["Timestamp"] == f"{today_str} 08:30:00"
+
+    @patch("custom_components.cat_care_tracker.google_sheets.build")
+    @patch("custom_components.cat_care_tracker.google_sheets.OAuthCredentials")
+    def test_get_entries_for_date_error(self, mock_creds, mock_build):
+        """Test a failed read is reported as no entries."""
+        from googleapiclient.errors import HttpError
+
+        mock_service = MagicMock()
+        mock_service.spreadsheets().values().get().execute.side_effect = HttpError(
+            resp=MagicMock(status=500), content=b"Backend error"
+        )
+        mock_build.return_value = mock_service
+
+        client = GoogleSheetsOAuthClient("test_token", "test_spreadsheet_id")
+
+        assert client.get_entries_for_date(date.today()) == []
+        assert client.get_last_entry_by_type(CHECKIN_TYPE_FOOD) is None
+        assert client.get_today_counts()[CHECKIN_TYPE_FOOD] == 0
+
 
 class TestGoogleSheetsClient:
     """Tests for the service account based GoogleSheetsClient."""